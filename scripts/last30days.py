@@ -724,10 +724,20 @@ def main():
     report.video_error = research["errors"]["video"]
     report.discussions_error = research["errors"]["discussions"]
 
+    # Item lists are final past this point
+    report.freeze()
+
     # Attach AI summary from deep research
     if research["summary_data"]:
         report.summary = research["summary_data"].get("summary")
-        report.summary_citations = research["summary_data"].get("citations", [])
+        report.summary_citations = [
+            schema.Citation(
+                number=c.get("number", 0),
+                title=c.get("title", ""),
+                url=c.get("url", ""),
+            )
+            for c in research["summary_data"].get("citations", [])
+        ]
         report.summary_followups = research["summary_data"].get("followups", [])
 
     # Compute data quality
@@ -778,7 +788,7 @@ def output_result(
     if emit_mode == "compact":
         print(render.render_compact(report, missing_keys=missing_keys))
     elif emit_mode == "json":
-        print(json.dumps(report.to_dict(), indent=2))
+        print(report.to_json(indent=2))
     elif emit_mode == "md":
         print(render.render_full_report(report))
     elif emit_mode == "context":
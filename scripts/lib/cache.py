@@ -97,7 +97,8 @@ def save_cache(cache_key: str, data: dict):
 
     try:
         with open(cache_path, 'w') as f:
-            json.dump(data, f)
+            # Compact separators: cache files are machine-read only
+            json.dump(data, f, separators=(',', ':'))
     except OSError:
         pass  # Silently fail on cache write errors
 
@@ -1,6 +1,7 @@
 """Date utilities for last30days skill."""
 
-from datetime import datetime, timedelta, timezone
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
 from typing import Optional, Tuple
 
 
@@ -90,6 +91,19 @@ def get_date_confidence(date_str: Optional[str], from_date: str, to_date: str) -
         return 'low'
 
 
+@lru_cache(maxsize=4096)
+def _parse_ymd(date_str: str) -> Optional[date]:
+    """Parse a YYYY-MM-DD string, memoized.
+
+    Items frequently share date strings, so caching amortizes the
+    strptime cost across duplicates. 'Today' is never cached here.
+    """
+    try:
+        return datetime.strptime(date_str, "%Y-%m-%d").date()
+    except ValueError:
+        return None
+
+
 def days_ago(date_str: Optional[str]) -> Optional[int]:
     """Calculate how many days ago a date is.
 
@@ -98,13 +112,11 @@ def days_ago(date_str: Optional[str]) -> Optional[int]:
     if not date_str:
         return None
 
-    try:
-        dt = datetime.strptime(date_str, "%Y-%m-%d").date()
-        today = datetime.now(timezone.utc).date()
-        delta = today - dt
-        return delta.days
-    except ValueError:
+    dt = _parse_ymd(date_str)
+    if dt is None:
         return None
+    today = datetime.now(timezone.utc).date()
+    return (today - dt).days
 
 
 def recency_score(date_str: Optional[str], max_days: int = 30) -> int:
@@ -123,7 +135,11 @@ def recency_score(date_str: Optional[str], max_days: int = 30) -> int:
     age = days_ago(date_str)
     if age is None:
         return 0  # Unknown date gets worst score
+    return _score_from_age(age, max_days)
+
 
+def _score_from_age(age: int, max_days: int) -> int:
+    """Map a known age in days to the tiered recency score."""
     if age < 0:
         return 100  # Future date (treat as today)
     if age >= max_days:
@@ -149,6 +165,23 @@ def recency_score(date_str: Optional[str], max_days: int = 30) -> int:
         return int(49 - (age - 15) * (39 / remaining))
 
 
+def recency_scores(date_strs, max_days: int = 30) -> list:
+    """Batch recency_score over many date strings.
+
+    Resolves 'today' once for the whole batch instead of per item;
+    parsing still goes through the memoized _parse_ymd.
+    """
+    today = datetime.now(timezone.utc).date()
+    scores = []
+    for date_str in date_strs:
+        dt = _parse_ymd(date_str) if date_str else None
+        if dt is None:
+            scores.append(0)
+        else:
+            scores.append(_score_from_age((today - dt).days, max_days))
+    return scores
+
+
 def recency_score_linear(date_str: Optional[str], max_days: int = 30) -> int:
     """Calculate linear recency score (0-100) - legacy method.
 
@@ -122,11 +122,8 @@ def render_compact(report: schema.Report, limit: int = 15, missing_keys: str = "
             lines.append("")
             lines.append("**Citations:**")
             for cite in report.summary_citations[:10]:
-                num = cite.get("number", "")
-                title = cite.get("title", "")
-                url = cite.get("url", "")
-                if url:
-                    lines.append(f"  [{num}] {title} - {url}")
+                if cite.url:
+                    lines.append(f"  [{cite.number}] {cite.title} - {cite.url}")
         if report.summary_followups:
             lines.append("")
             lines.append("**Related questions:**")
@@ -1,11 +1,16 @@
 """Data schemas for last30days skill."""
 
-from dataclasses import dataclass, field, fields
-from typing import Any, Dict, List, Optional
+import json
+import sys
+from dataclasses import MISSING, dataclass, field, fields
+from itertools import chain
+from typing import Any, ClassVar, Dict, List, NamedTuple, Optional, Tuple
 from datetime import datetime, timezone
 
+from . import dates as dates_module
 
-@dataclass
+
+@dataclass(slots=True)
 class Engagement:
     """Engagement metrics."""
     # Reddit fields
@@ -24,66 +29,103 @@ class Engagement:
     # HackerNews fields
     points: Optional[int] = None
 
+    # Field names in serialization order; filled in from the dataclass
+    # fields right after the class body so it can never drift
+    _FIELDS: ClassVar[Tuple[str, ...]] = ()
+
     def to_dict(self) -> Optional[Dict[str, Any]]:
-        d = {}
-        if self.score is not None:
-            d['score'] = self.score
-        if self.num_comments is not None:
-            d['num_comments'] = self.num_comments
-        if self.upvote_ratio is not None:
-            d['upvote_ratio'] = self.upvote_ratio
-        if self.likes is not None:
-            d['likes'] = self.likes
-        if self.reposts is not None:
-            d['reposts'] = self.reposts
-        if self.replies is not None:
-            d['replies'] = self.replies
-        if self.quotes is not None:
-            d['quotes'] = self.quotes
-        if self.views is not None:
-            d['views'] = self.views
-        if self.bookmarks is not None:
-            d['bookmarks'] = self.bookmarks
-        if self.points is not None:
-            d['points'] = self.points
+        d = {k: v for k in self._FIELDS if (v := getattr(self, k)) is not None}
         return d if d else None
 
 
-@dataclass
-class Comment:
-    """Reddit comment."""
+Engagement._FIELDS = tuple(f.name for f in fields(Engagement))
+
+
+def _intern_soft(value: Optional[str]) -> Optional[str]:
+    """Intern a string, passing None through (legacy caches store null)."""
+    return sys.intern(value) if value is not None else None
+
+
+def _codegen_to_dict(cls):
+    """Generate a specialized ``to_dict`` for an item dataclass.
+
+    Emits a single dict-literal expression referencing each field directly
+    (with the known nested fields serialized inline), compiles it once at
+    class-definition time, and binds it as ``to_dict``. Keeps serialization
+    in sync with the declared fields and avoids per-call reflection.
+    """
+    parts = []
+    needs_comment = False
+    for f in fields(cls):
+        name = f.name
+        if name == 'engagement':
+            parts.append(f"'{name}': self.engagement.to_dict() if self.engagement else None")
+        elif name == 'subs':
+            parts.append(f"'{name}': self.subs.to_dict()")
+        elif name == 'top_comments':
+            # map() dispatches the bound-once method at C level per element
+            parts.append(f"'{name}': list(map(_comment_to_dict, self.top_comments))")
+            needs_comment = True
+        else:
+            parts.append(f"'{name}': self.{name}")
+    src = "def to_dict(self):\n    return {" + ", ".join(parts) + "}"
+    ns: Dict[str, Any] = {'_comment_to_dict': Comment.to_dict} if needs_comment else {}
+    exec(src, ns)
+    cls.to_dict = ns['to_dict']
+    # Cache the field tuple on the class; dataclasses.fields() re-reads
+    # __dataclass_fields__ on every call, and from_dict runs per item.
+    cls._FIELDS_TUPLE = tuple(fields(cls))
+    return cls
+
+
+class Comment(NamedTuple):
+    """Reddit comment.
+
+    A NamedTuple like SubScores: five immutable fields, built in bulk
+    during normalization and cache reload, never mutated afterwards.
+    """
     score: int
     date: Optional[str]
     author: str
     excerpt: str
     url: str
 
+    def to_dict(self) -> Dict[str, Any]:
+        return self._asdict()
+
+
+@dataclass(slots=True)
+class Citation:
+    """Summary citation from Perplexity deep research."""
+    number: int = 0
+    title: str = ""
+    url: str = ""
+
     def to_dict(self) -> Dict[str, Any]:
         return {
-            'score': self.score,
-            'date': self.date,
-            'author': self.author,
-            'excerpt': self.excerpt,
+            'number': self.number,
+            'title': self.title,
             'url': self.url,
         }
 
 
-@dataclass
-class SubScores:
-    """Component scores."""
+class SubScores(NamedTuple):
+    """Component scores.
+
+    A NamedTuple rather than a dataclass: there is one per item, it is
+    never mutated after scoring assigns it, and tuple construction and
+    _asdict serialization both run at C level.
+    """
     relevance: int = 0
     recency: int = 0
     engagement: int = 0
 
     def to_dict(self) -> Dict[str, int]:
-        return {
-            'relevance': self.relevance,
-            'recency': self.recency,
-            'engagement': self.engagement,
-        }
+        return self._asdict()
 
 
-@dataclass
+@_codegen_to_dict
+@dataclass(slots=True)
 class RedditItem:
     """Normalized Reddit item."""
     id: str
@@ -101,26 +143,16 @@ class RedditItem:
     subs: SubScores = field(default_factory=SubScores)
     score: int = 0
 
-    def to_dict(self) -> Dict[str, Any]:
-        return {
-            'id': self.id,
-            'title': self.title,
-            'url': self.url,
-            'subreddit': self.subreddit,
-            'date': self.date,
-            'date_confidence': self.date_confidence,
-            'engagement': self.engagement.to_dict() if self.engagement else None,
-            'engagement_verified': self.engagement_verified,
-            'top_comments': [c.to_dict() for c in self.top_comments],
-            'comment_insights': self.comment_insights,
-            'relevance': self.relevance,
-            'why_relevant': self.why_relevant,
-            'subs': self.subs.to_dict(),
-            'score': self.score,
-        }
+    def __post_init__(self):
+        # Small-cardinality strings repeated across many items; interning
+        # dedupes the allocations and makes the hot date_confidence
+        # comparisons in compute_data_quality pointer checks.
+        self.subreddit = _intern_soft(self.subreddit)
+        self.date_confidence = _intern_soft(self.date_confidence)
 
 
-@dataclass
+@_codegen_to_dict
+@dataclass(slots=True)
 class XItem:
     """Normalized X item."""
     id: str
@@ -137,25 +169,12 @@ class XItem:
     subs: SubScores = field(default_factory=SubScores)
     score: int = 0
 
-    def to_dict(self) -> Dict[str, Any]:
-        return {
-            'id': self.id,
-            'text': self.text,
-            'url': self.url,
-            'author_handle': self.author_handle,
-            'date': self.date,
-            'date_confidence': self.date_confidence,
-            'engagement': self.engagement.to_dict() if self.engagement else None,
-            'engagement_verified': self.engagement_verified,
-            'has_media': self.has_media,
-            'relevance': self.relevance,
-            'why_relevant': self.why_relevant,
-            'subs': self.subs.to_dict(),
-            'score': self.score,
-        }
+    def __post_init__(self):
+        self.date_confidence = _intern_soft(self.date_confidence)
 
 
-@dataclass
+@_codegen_to_dict
+@dataclass(slots=True)
 class HNItem:
     """Normalized HackerNews item."""
     id: str
@@ -172,25 +191,12 @@ class HNItem:
     subs: SubScores = field(default_factory=SubScores)
     score: int = 0
 
-    def to_dict(self) -> Dict[str, Any]:
-        return {
-            'id': self.id,
-            'title': self.title,
-            'url': self.url,
-            'hn_url': self.hn_url,
-            'author': self.author,
-            'date': self.date,
-            'date_confidence': self.date_confidence,
-            'engagement': self.engagement.to_dict() if self.engagement else None,
-            'engagement_verified': self.engagement_verified,
-            'relevance': self.relevance,
-            'why_relevant': self.why_relevant,
-            'subs': self.subs.to_dict(),
-            'score': self.score,
-        }
+    def __post_init__(self):
+        self.date_confidence = _intern_soft(self.date_confidence)
 
 
-@dataclass
+@_codegen_to_dict
+@dataclass(slots=True)
 class NewsItem:
     """Normalized news article from Perplexity News Search."""
     id: str
@@ -207,25 +213,13 @@ class NewsItem:
     subs: SubScores = field(default_factory=SubScores)
     score: int = 0
 
-    def to_dict(self) -> Dict[str, Any]:
-        return {
-            'id': self.id,
-            'title': self.title,
-            'url': self.url,
-            'source_name': self.source_name,
-            'source_domain': self.source_domain,
-            'date': self.date,
-            'date_confidence': self.date_confidence,
-            'snippet': self.snippet,
-            'extra_snippets': self.extra_snippets,
-            'relevance': self.relevance,
-            'why_relevant': self.why_relevant,
-            'subs': self.subs.to_dict(),
-            'score': self.score,
-        }
+    def __post_init__(self):
+        self.source_domain = _intern_soft(self.source_domain)
+        self.date_confidence = _intern_soft(self.date_confidence)
 
 
-@dataclass
+@_codegen_to_dict
+@dataclass(slots=True)
 class WebItem:
     """Normalized web result from Perplexity Web Search."""
     id: str
@@ -242,25 +236,13 @@ class WebItem:
     subs: SubScores = field(default_factory=SubScores)
     score: int = 0
 
-    def to_dict(self) -> Dict[str, Any]:
-        return {
-            'id': self.id,
-            'title': self.title,
-            'url': self.url,
-            'source_domain': self.source_domain,
-            'snippet': self.snippet,
-            'extra_snippets': self.extra_snippets,
-            'date': self.date,
-            'date_confidence': self.date_confidence,
-            'is_cited': self.is_cited,
-            'relevance': self.relevance,
-            'why_relevant': self.why_relevant,
-            'subs': self.subs.to_dict(),
-            'score': self.score,
-        }
+    def __post_init__(self):
+        self.source_domain = _intern_soft(self.source_domain)
+        self.date_confidence = _intern_soft(self.date_confidence)
 
 
-@dataclass
+@_codegen_to_dict
+@dataclass(slots=True)
 class VideoItem:
     """Normalized video result from Perplexity Video Search."""
     id: str
@@ -278,26 +260,13 @@ class VideoItem:
     subs: SubScores = field(default_factory=SubScores)
     score: int = 0
 
-    def to_dict(self) -> Dict[str, Any]:
-        return {
-            'id': self.id,
-            'title': self.title,
-            'url': self.url,
-            'source_domain': self.source_domain,
-            'creator': self.creator,
-            'date': self.date,
-            'date_confidence': self.date_confidence,
-            'thumbnail_url': self.thumbnail_url,
-            'duration': self.duration,
-            'snippet': self.snippet,
-            'relevance': self.relevance,
-            'why_relevant': self.why_relevant,
-            'subs': self.subs.to_dict(),
-            'score': self.score,
-        }
+    def __post_init__(self):
+        self.source_domain = _intern_soft(self.source_domain)
+        self.date_confidence = _intern_soft(self.date_confidence)
 
 
-@dataclass
+@_codegen_to_dict
+@dataclass(slots=True)
 class DiscussionItem:
     """Normalized discussion/forum result from Perplexity Discussions Search."""
     id: str
@@ -313,24 +282,12 @@ class DiscussionItem:
     subs: SubScores = field(default_factory=SubScores)
     score: int = 0
 
-    def to_dict(self) -> Dict[str, Any]:
-        return {
-            'id': self.id,
-            'title': self.title,
-            'url': self.url,
-            'forum_name': self.forum_name,
-            'date': self.date,
-            'date_confidence': self.date_confidence,
-            'snippet': self.snippet,
-            'extra_snippets': self.extra_snippets,
-            'relevance': self.relevance,
-            'why_relevant': self.why_relevant,
-            'subs': self.subs.to_dict(),
-            'score': self.score,
-        }
+    def __post_init__(self):
+        self.forum_name = _intern_soft(self.forum_name)
+        self.date_confidence = _intern_soft(self.date_confidence)
 
 
-@dataclass
+@dataclass(slots=True)
 class DataQuality:
     """Data quality metrics for transparency."""
     total_items: int = 0
@@ -341,21 +298,25 @@ class DataQuality:
     sources_failed: List[str] = field(default_factory=list)
     has_summary: bool = False
 
-    @property
-    def verified_dates_percent(self) -> float:
-        return (self.verified_dates_count / self.total_items * 100) if self.total_items > 0 else 0
+    # Derived once from the counts above; they never change after
+    # compute_data_quality, so recomputing per serialization is wasted work.
+    verified_dates_percent: float = field(init=False)
+    verified_engagement_percent: float = field(init=False)
 
-    @property
-    def verified_engagement_percent(self) -> float:
-        return (self.verified_engagement_count / self.total_items * 100) if self.total_items > 0 else 0
+    def __post_init__(self):
+        total = self.total_items
+        # Stored pre-rounded: every consumer (to_dict, render) wants the
+        # one-decimal form, so round here instead of per serialization.
+        self.verified_dates_percent = round(self.verified_dates_count / total * 100, 1) if total > 0 else 0
+        self.verified_engagement_percent = round(self.verified_engagement_count / total * 100, 1) if total > 0 else 0
 
     def to_dict(self) -> Dict[str, Any]:
         return {
             'total_items': self.total_items,
             'verified_dates_count': self.verified_dates_count,
-            'verified_dates_percent': round(self.verified_dates_percent, 1),
+            'verified_dates_percent': self.verified_dates_percent,
             'verified_engagement_count': self.verified_engagement_count,
-            'verified_engagement_percent': round(self.verified_engagement_percent, 1),
+            'verified_engagement_percent': self.verified_engagement_percent,
             'avg_recency_days': round(self.avg_recency_days, 1),
             'sources_available': self.sources_available,
             'sources_failed': self.sources_failed,
@@ -363,7 +324,115 @@ class DataQuality:
         }
 
 
-@dataclass
+def _build_engagement(raw: Optional[Dict]) -> Optional[Engagement]:
+    if not raw:
+        return None
+    # Positional construction; kwargs unpacking allocates a temporary dict
+    # and runs keyword matching per item
+    return Engagement(*map(raw.get, Engagement._FIELDS))
+
+
+# Shared all-zeros SubScores; safe to reuse because SubScores is an
+# immutable NamedTuple and scoring assigns a fresh instance.
+_ZERO_SUBS = SubScores()
+
+
+def _build_subs(raw: Optional[Dict]) -> SubScores:
+    if not raw:
+        return _ZERO_SUBS
+    return SubScores(raw.get('relevance', 0), raw.get('recency', 0), raw.get('engagement', 0))
+
+
+def _build_comments(raw: Optional[List[Dict]]) -> List[Comment]:
+    if not raw:
+        return []
+    return [
+        Comment(c['score'], c.get('date'), c['author'], c['excerpt'], c['url'])
+        for c in raw
+    ]
+
+
+def _build_citations(raw: Optional[List[Dict]]) -> List[Citation]:
+    if not raw:
+        return []
+    return [
+        Citation(
+            number=c.get('number', 0),
+            title=c.get('title', ''),
+            url=c.get('url', ''),
+        )
+        for c in raw
+    ]
+
+
+def _build_data_quality(raw: Optional[Dict]) -> Optional[DataQuality]:
+    if not raw:
+        return None
+    # Only pass known DataQuality fields (handles old cached data with
+    # removed fields; derived percent fields are recomputed on init)
+    valid_keys = {f.name for f in fields(DataQuality) if f.init}
+    clean = {k: v for k, v in raw.items() if k in valid_keys}
+    return DataQuality(**clean)
+
+
+# Report attribute -> item class, driving the generic from_dict reconstruction
+_ITEM_SPECS = (
+    ('reddit', RedditItem),
+    ('x', XItem),
+    ('hn', HNItem),
+    ('news', NewsItem),
+    ('web', WebItem),
+    ('videos', VideoItem),
+    ('discussions', DiscussionItem),
+)
+
+# Nested fields that need dedicated reconstruction
+_NESTED_BUILDERS = {
+    'engagement': _build_engagement,
+    'subs': _build_subs,
+    'top_comments': _build_comments,
+}
+
+# Legacy cache keys still accepted as fallbacks for renamed fields
+_LEGACY_KEYS = {
+    'is_cited': 'has_schema_data',
+}
+
+# Required string fields that older cache schemas omitted; decode them
+# as '' the way the hand-written builders' .get(name, '') used to
+_SOFT_DEFAULTS = {
+    'hn_url': '',
+    'author': '',
+    'source_name': '',
+    'source_domain': '',
+    'forum_name': '',
+}
+
+def _build_item(cls, raw: Dict[str, Any]):
+    """Reconstruct one item dataclass from its serialized dict."""
+    kwargs = {}
+    for f in cls._FIELDS_TUPLE:
+        name = f.name
+        if name in _NESTED_BUILDERS:
+            kwargs[name] = _NESTED_BUILDERS[name](raw.get(name))
+        elif name in raw:
+            kwargs[name] = raw[name]
+        elif name in _LEGACY_KEYS and _LEGACY_KEYS[name] in raw:
+            kwargs[name] = raw[_LEGACY_KEYS[name]]
+        elif f.default is not MISSING:
+            kwargs[name] = f.default
+        elif f.default_factory is not MISSING:
+            kwargs[name] = f.default_factory()
+        elif name in _SOFT_DEFAULTS:
+            kwargs[name] = _SOFT_DEFAULTS[name]
+        else:
+            # Required field missing from the cache entry; fail like a
+            # direct raw[name] lookup would.
+            raise KeyError(name)
+    return cls(**kwargs)
+
+
+@dataclass(slots=True)
 class Report:
     """Full research report."""
     topic: str
@@ -388,7 +457,7 @@ class Report:
 
     # Perplexity enrichment data
     summary: Optional[str] = None
-    summary_citations: List[Dict] = field(default_factory=list)
+    summary_citations: List[Citation] = field(default_factory=list)
     summary_followups: List[str] = field(default_factory=list)
 
     # Errors per source
@@ -410,6 +479,14 @@ class Report:
     # Data quality metrics
     data_quality: Optional[DataQuality] = None
 
+    # Scalar fields serialized only when truthy (see to_dict)
+    _OPTIONAL_KEYS: ClassVar[Tuple[str, ...]] = (
+        'summary', 'summary_followups',
+        'reddit_error', 'x_error', 'hn_error', 'news_error',
+        'web_error', 'video_error', 'discussions_error',
+        'from_cache', 'context_snippet_md',
+    )
+
     def to_dict(self) -> Dict[str, Any]:
         d = {
             'topic': self.topic,
@@ -420,53 +497,71 @@ class Report:
             'generated_at': self.generated_at,
             'mode': self.mode,
             'xai_model_used': self.xai_model_used,
-            'reddit': [r.to_dict() for r in self.reddit],
-            'x': [x.to_dict() for x in self.x],
-            'hn': [h.to_dict() for h in self.hn],
-            'news': [n.to_dict() for n in self.news],
-            'web': [w.to_dict() for w in self.web],
-            'videos': [v.to_dict() for v in self.videos],
-            'discussions': [d_.to_dict() for d_ in self.discussions],
+            'reddit': list(map(RedditItem.to_dict, self.reddit)),
+            'x': list(map(XItem.to_dict, self.x)),
+            'hn': list(map(HNItem.to_dict, self.hn)),
+            'news': list(map(NewsItem.to_dict, self.news)),
+            'web': list(map(WebItem.to_dict, self.web)),
+            'videos': list(map(VideoItem.to_dict, self.videos)),
+            'discussions': list(map(DiscussionItem.to_dict, self.discussions)),
         }
 
-        # Perplexity enrichment
-        if self.summary:
-            d['summary'] = self.summary
+        # Optional keys (enrichment, errors, cache info), emitted only when
+        # set -- one loop instead of a dozen check-and-store branches
+        d |= {key: v for key in self._OPTIONAL_KEYS if (v := getattr(self, key))}
+
         if self.summary_citations:
-            d['summary_citations'] = self.summary_citations
-        if self.summary_followups:
-            d['summary_followups'] = self.summary_followups
-
-        # Errors
-        if self.reddit_error:
-            d['reddit_error'] = self.reddit_error
-        if self.x_error:
-            d['x_error'] = self.x_error
-        if self.hn_error:
-            d['hn_error'] = self.hn_error
-        if self.news_error:
-            d['news_error'] = self.news_error
-        if self.web_error:
-            d['web_error'] = self.web_error
-        if self.video_error:
-            d['video_error'] = self.video_error
-        if self.discussions_error:
-            d['discussions_error'] = self.discussions_error
-
-        # Cache
-        if self.from_cache:
-            d['from_cache'] = self.from_cache
+            d['summary_citations'] = [c.to_dict() for c in self.summary_citations]
+
         if self.cache_age_hours is not None:
             d['cache_age_hours'] = self.cache_age_hours
 
-        if self.context_snippet_md:
-            d['context_snippet_md'] = self.context_snippet_md
-
         if self.data_quality:
             d['data_quality'] = self.data_quality.to_dict()
 
         return d
 
+    def freeze(self) -> None:
+        """Convert the per-source item lists to tuples.
+
+        Called once after fetch/scoring completes; the lists are never
+        mutated afterwards, and tuples make that explicit while giving
+        downstream passes the cheaper tuple iterator.
+        """
+        for attr, _ in _ITEM_SPECS:
+            setattr(self, attr, tuple(getattr(self, attr)))
+
+    def iter_json_lines(self):
+        """Stream the report as NDJSON lines (newline included).
+
+        Yields one header line with the report metadata, then one line per
+        item tagged with its source. Lets writers stream large reports
+        without materializing the full nested to_dict tree.
+        """
+        header = {
+            'topic': self.topic,
+            'range': {'from': self.range_from, 'to': self.range_to},
+            'generated_at': self.generated_at,
+            'mode': self.mode,
+        }
+        if self.data_quality:
+            header['data_quality'] = self.data_quality.to_dict()
+        yield json.dumps(header, separators=(',', ':')) + '\n'
+        for attr, _ in _ITEM_SPECS:
+            for item in getattr(self, attr):
+                yield json.dumps(
+                    {'type': attr, 'item': item.to_dict()},
+                    separators=(',', ':'),
+                ) + '\n'
+
+    def to_json(self, indent: Optional[int] = None) -> str:
+        """Serialize straight to a JSON string.
+
+        Single entry point for JSON sinks so callers don't each pair
+        to_dict() with their own json.dumps().
+        """
+        return json.dumps(self.to_dict(), indent=indent, separators=None if indent else (',', ':'))
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Report":
         """Create Report from serialized dict (handles cache format)."""
@@ -474,136 +569,11 @@ class Report:
         range_from = range_data.get('from', data.get('range_from', ''))
         range_to = range_data.get('to', data.get('range_to', ''))
 
-        def _build_engagement(raw: Optional[Dict]) -> Optional[Engagement]:
-            if not raw:
-                return None
-            return Engagement(**raw)
-
-        def _build_subs(raw: Optional[Dict]) -> SubScores:
-            if not raw:
-                return SubScores()
-            return SubScores(**raw)
-
-        def _build_data_quality(raw: Optional[Dict]) -> Optional[DataQuality]:
-            if not raw:
-                return None
-            # Only pass known DataQuality fields (handles old cached data with removed fields)
-            valid_keys = {f.name for f in fields(DataQuality)}
-            clean = {k: v for k, v in raw.items() if k in valid_keys}
-            return DataQuality(**clean)
-
-        # Reconstruct Reddit items
-        reddit_items = []
-        for r in data.get('reddit', []):
-            comments = [Comment(**c) for c in r.get('top_comments', [])]
-            reddit_items.append(RedditItem(
-                id=r['id'], title=r['title'], url=r['url'],
-                subreddit=r['subreddit'],
-                date=r.get('date'), date_confidence=r.get('date_confidence', 'low'),
-                engagement=_build_engagement(r.get('engagement')),
-                engagement_verified=r.get('engagement_verified', False),
-                top_comments=comments,
-                comment_insights=r.get('comment_insights', []),
-                relevance=r.get('relevance', 0.5),
-                why_relevant=r.get('why_relevant', ''),
-                subs=_build_subs(r.get('subs')),
-                score=r.get('score', 0),
-            ))
-
-        # Reconstruct X items
-        x_items = []
-        for x in data.get('x', []):
-            x_items.append(XItem(
-                id=x['id'], text=x['text'], url=x['url'],
-                author_handle=x['author_handle'],
-                date=x.get('date'), date_confidence=x.get('date_confidence', 'low'),
-                engagement=_build_engagement(x.get('engagement')),
-                engagement_verified=x.get('engagement_verified', False),
-                has_media=x.get('has_media', False),
-                relevance=x.get('relevance', 0.5),
-                why_relevant=x.get('why_relevant', ''),
-                subs=_build_subs(x.get('subs')),
-                score=x.get('score', 0),
-            ))
-
-        # Reconstruct HN items
-        hn_items = []
-        for h in data.get('hn', []):
-            hn_items.append(HNItem(
-                id=h['id'], title=h['title'], url=h['url'],
-                hn_url=h.get('hn_url', ''), author=h.get('author', ''),
-                date=h.get('date'), date_confidence=h.get('date_confidence', 'low'),
-                engagement=_build_engagement(h.get('engagement')),
-                engagement_verified=h.get('engagement_verified', True),
-                relevance=h.get('relevance', 0.5),
-                why_relevant=h.get('why_relevant', ''),
-                subs=_build_subs(h.get('subs')),
-                score=h.get('score', 0),
-            ))
-
-        # Reconstruct News items
-        news_items = []
-        for n in data.get('news', []):
-            news_items.append(NewsItem(
-                id=n['id'], title=n['title'], url=n['url'],
-                source_name=n.get('source_name', ''),
-                source_domain=n.get('source_domain', ''),
-                date=n.get('date'), date_confidence=n.get('date_confidence', 'high'),
-                snippet=n.get('snippet', ''),
-                extra_snippets=n.get('extra_snippets', []),
-                relevance=n.get('relevance', 0.5),
-                why_relevant=n.get('why_relevant', ''),
-                subs=_build_subs(n.get('subs')),
-                score=n.get('score', 0),
-            ))
-
-        # Reconstruct Web items
-        web_items = []
-        for w in data.get('web', []):
-            web_items.append(WebItem(
-                id=w['id'], title=w['title'], url=w['url'],
-                source_domain=w.get('source_domain', ''),
-                snippet=w.get('snippet', ''),
-                extra_snippets=w.get('extra_snippets', []),
-                date=w.get('date'), date_confidence=w.get('date_confidence', 'high'),
-                is_cited=w.get('is_cited', w.get('has_schema_data', False)),
-                relevance=w.get('relevance', 0.5),
-                why_relevant=w.get('why_relevant', ''),
-                subs=_build_subs(w.get('subs')),
-                score=w.get('score', 0),
-            ))
-
-        # Reconstruct Video items
-        video_items = []
-        for v in data.get('videos', []):
-            video_items.append(VideoItem(
-                id=v['id'], title=v['title'], url=v['url'],
-                source_domain=v.get('source_domain', ''),
-                creator=v.get('creator'),
-                date=v.get('date'), date_confidence=v.get('date_confidence', 'high'),
-                thumbnail_url=v.get('thumbnail_url'),
-                duration=v.get('duration'),
-                snippet=v.get('snippet', ''),
-                relevance=v.get('relevance', 0.5),
-                why_relevant=v.get('why_relevant', ''),
-                subs=_build_subs(v.get('subs')),
-                score=v.get('score', 0),
-            ))
-
-        # Reconstruct Discussion items
-        discussion_items = []
-        for d_ in data.get('discussions', []):
-            discussion_items.append(DiscussionItem(
-                id=d_['id'], title=d_['title'], url=d_['url'],
-                forum_name=d_.get('forum_name', ''),
-                date=d_.get('date'), date_confidence=d_.get('date_confidence', 'high'),
-                snippet=d_.get('snippet', ''),
-                extra_snippets=d_.get('extra_snippets', []),
-                relevance=d_.get('relevance', 0.5),
-                why_relevant=d_.get('why_relevant', ''),
-                subs=_build_subs(d_.get('subs')),
-                score=d_.get('score', 0),
-            ))
+        # Reconstruct item lists generically from the spec table
+        item_lists = {
+            attr: [_build_item(item_cls, raw) for raw in data.get(attr, [])]
+            for attr, item_cls in _ITEM_SPECS
+        }
 
         return cls(
             topic=data['topic'],
@@ -612,15 +582,8 @@ class Report:
             generated_at=data['generated_at'],
             mode=data['mode'],
             xai_model_used=data.get('xai_model_used'),
-            reddit=reddit_items,
-            x=x_items,
-            hn=hn_items,
-            news=news_items,
-            web=web_items,
-            videos=video_items,
-            discussions=discussion_items,
             summary=data.get('summary'),
-            summary_citations=data.get('summary_citations', []),
+            summary_citations=_build_citations(data.get('summary_citations')),
             summary_followups=data.get('summary_followups', []),
             reddit_error=data.get('reddit_error'),
             x_error=data.get('x_error'),
@@ -633,6 +596,7 @@ class Report:
             cache_age_hours=data.get('cache_age_hours'),
             context_snippet_md=data.get('context_snippet_md', ''),
             data_quality=_build_data_quality(data.get('data_quality')),
+            **item_lists,
         )
 
 
@@ -654,60 +618,59 @@ def create_report(
     )
 
 
+# (source name, items attribute, error attribute) for availability checks
+_SOURCES = (
+    ("reddit", "reddit", "reddit_error"),
+    ("x", "x", "x_error"),
+    ("hn", "hn", "hn_error"),
+    ("news", "news", "news_error"),
+    ("web", "web", "web_error"),
+    ("videos", "videos", "video_error"),
+    ("discussions", "discussions", "discussions_error"),
+)
+
+
 def compute_data_quality(report: Report) -> DataQuality:
     """Compute data quality metrics for a report."""
-    all_items = (
-        list(report.reddit) + list(report.x) + list(report.hn) +
-        list(report.news) + list(report.web) + list(report.videos) +
-        list(report.discussions)
+    groups = (
+        report.reddit, report.x, report.hn,
+        report.news, report.web, report.videos, report.discussions,
     )
-    total = len(all_items)
+    total = sum(map(len, groups))
 
     if total == 0:
         return DataQuality(total_items=0)
 
-    # Count verified dates (high confidence)
-    verified_dates = sum(1 for item in all_items if item.date_confidence == "high")
-
-    # Count verified engagement (Reddit enriched + X + HN)
-    verified_engagement = 0
-    for item in report.reddit:
-        if item.engagement_verified:
-            verified_engagement += 1
-    for item in report.x:
-        if item.engagement_verified:
-            verified_engagement += 1
-    for item in report.hn:
-        if item.engagement_verified:
-            verified_engagement += 1
-
-    # Calculate average recency
-    from . import dates as dates_module
-    recency_days = []
-    for item in all_items:
+    # Single pass over all items: count verified dates (high confidence)
+    # and accumulate recency without materializing a concatenated list.
+    days_ago = dates_module.days_ago
+    verified_dates = 0
+    recency_sum = 0.0
+    recency_n = 0
+    for item in chain.from_iterable(groups):
+        if item.date_confidence == "high":
+            verified_dates += 1
         if item.date:
-            age = dates_module.days_ago(item.date)
+            age = days_ago(item.date)
             if age is not None:
-                recency_days.append(age)
-    avg_recency = sum(recency_days) / len(recency_days) if recency_days else 30.0
+                recency_sum += age
+                recency_n += 1
 
-    # Determine sources used/failed
-    source_map = [
-        ("reddit", report.reddit, report.reddit_error),
-        ("x", report.x, report.x_error),
-        ("hn", report.hn, report.hn_error),
-        ("news", report.news, report.news_error),
-        ("web", report.web, report.web_error),
-        ("videos", report.videos, report.video_error),
-        ("discussions", report.discussions, report.discussions_error),
-    ]
+    # Count verified engagement (Reddit enriched + X + HN)
+    verified_engagement = sum(
+        1 for item in chain(report.reddit, report.x, report.hn)
+        if item.engagement_verified
+    )
 
+    avg_recency = recency_sum / recency_n if recency_n else 30.0
+
+    # Determine sources used/failed
     sources_available = []
     sources_failed = []
-    for name, items, error in source_map:
-        if items:
+    for name, items_attr, error_attr in _SOURCES:
+        if getattr(report, items_attr):
             sources_available.append(name)
-        elif error:
+        elif getattr(report, error_attr):
             sources_failed.append(name)
 
     return DataQuality(
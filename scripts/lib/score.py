@@ -1,6 +1,7 @@
 """Popularity-aware scoring for last30days skill."""
 
 import math
+from functools import lru_cache
 from typing import List, Optional, Union
 
 from . import dates, schema
@@ -117,37 +118,39 @@ def compute_hn_engagement_raw(engagement: Optional[schema.Engagement]) -> Option
 
 def normalize_to_100(values: List[float], default: float = 50) -> List[float]:
     """Normalize a list of values to 0-100 scale."""
-    valid = [v for v in values if v is not None]
-    if not valid:
-        return [default if v is None else 50 for v in values]
+    # Single pass for min/max over non-None values; avoids materializing
+    # a filtered copy just to call min()/max() on it.
+    min_val = max_val = None
+    for v in values:
+        if v is None:
+            continue
+        if min_val is None or v < min_val:
+            min_val = v
+        if max_val is None or v > max_val:
+            max_val = v
 
-    min_val = min(valid)
-    max_val = max(valid)
-    range_val = max_val - min_val
+    if min_val is None:
+        return [default for _ in values]
 
+    range_val = max_val - min_val
     if range_val == 0:
-        return [50 if v is None else 50 for v in values]
+        return [50 for _ in values]
+
+    scale = 100 / range_val
+    return [None if v is None else (v - min_val) * scale for v in values]
 
-    result = []
-    for v in values:
-        if v is None:
-            result.append(None)
-        else:
-            normalized = ((v - min_val) / range_val) * 100
-            result.append(normalized)
 
-    return result
+# Score adjustment per date confidence level; unknown levels adjust by 0
+_DATE_CONF_ADJ = {
+    "high": HIGH_DATE_BONUS,
+    "med": -5,
+    "low": -NO_DATE_PENALTY,
+}
 
 
 def _apply_date_confidence(overall: float, date_confidence: str) -> float:
     """Apply date confidence adjustments to score."""
-    if date_confidence == "high":
-        overall += HIGH_DATE_BONUS
-    elif date_confidence == "low":
-        overall -= NO_DATE_PENALTY
-    elif date_confidence == "med":
-        overall -= 5
-    return overall
+    return overall + _DATE_CONF_ADJ.get(date_confidence, 0)
 
 
 def _score_with_engagement(
@@ -163,17 +166,26 @@ def _score_with_engagement(
 
     eng_raw = [compute_engagement_fn(item.engagement) for item in items]
     eng_normalized = normalize_to_100(eng_raw)
+    rec_scores = dates.recency_scores([item.date for item in items])
+
+    # Local bindings: LOAD_FAST beats LOAD_GLOBAL/attribute lookup in
+    # the per-item loop
+    sub_scores = schema.SubScores
+    default_eng = DEFAULT_ENGAGEMENT
+    verified_bonus = VERIFIED_ENGAGEMENT_BONUS
+    unknown_penalty = UNKNOWN_ENGAGEMENT_PENALTY
+    conf_adj = _DATE_CONF_ADJ.get
 
     for i, item in enumerate(items):
         rel_score = int(item.relevance * 100)
-        rec_score = dates.recency_score(item.date)
+        rec_score = rec_scores[i]
 
         if eng_normalized[i] is not None:
             eng_score = int(eng_normalized[i])
         else:
-            eng_score = DEFAULT_ENGAGEMENT
+            eng_score = default_eng
 
-        item.subs = schema.SubScores(
+        item.subs = sub_scores(
             relevance=rel_score,
             recency=rec_score,
             engagement=eng_score,
@@ -186,11 +198,11 @@ def _score_with_engagement(
         )
 
         if item.engagement_verified:
-            overall += VERIFIED_ENGAGEMENT_BONUS
+            overall += verified_bonus
         elif eng_raw[i] is None:
-            overall -= UNKNOWN_ENGAGEMENT_PENALTY
+            overall -= unknown_penalty
 
-        overall = _apply_date_confidence(overall, item.date_confidence)
+        overall += conf_adj(item.date_confidence, 0)
         item.score = max(0, min(100, int(overall)))
 
     return items
@@ -220,76 +232,90 @@ def score_hn_items(items: List[schema.HNItem]) -> List[schema.HNItem]:
     return _score_with_engagement(items, compute_hn_engagement_raw)
 
 
-def score_news_items(items: List[schema.NewsItem]) -> List[schema.NewsItem]:
-    """Compute scores for News items.
+def _score_without_engagement(
+    items: list,
+    weight_rel: float,
+    weight_rec: float,
+    weight_eng: float = 0.0,
+    eng_fn=None,
+    adjust_fn=None,
+) -> list:
+    """Generic scoring for sources without verified engagement data.
 
-    Weights: 45% relevance + 55% recency (time-sensitive, no engagement data)
-    News articles are time-critical so recency gets higher weight.
+    ``eng_fn`` maps an item to a 0-100 engagement-proxy score (absent means
+    0), ``adjust_fn`` returns a flat bonus/penalty for the item. The four
+    source-specific loops differ only in these hooks and their weights.
     """
     if not items:
         return items
 
-    for item in items:
+    rec_scores = dates.recency_scores([item.date for item in items])
+
+    for i, item in enumerate(items):
         rel_score = int(item.relevance * 100)
-        rec_score = dates.recency_score(item.date)
+        rec_score = rec_scores[i]
+        eng_score = eng_fn(item) if eng_fn is not None else 0
 
         item.subs = schema.SubScores(
             relevance=rel_score,
             recency=rec_score,
-            engagement=0,
+            engagement=eng_score,
         )
 
         overall = (
-            NEWS_WEIGHT_RELEVANCE * rel_score +
-            NEWS_WEIGHT_RECENCY * rec_score
+            weight_rel * rel_score +
+            weight_rec * rec_score +
+            weight_eng * eng_score
         )
 
+        if adjust_fn is not None:
+            overall += adjust_fn(item)
+
         overall = _apply_date_confidence(overall, item.date_confidence)
         item.score = max(0, min(100, int(overall)))
 
     return items
 
 
-def score_web_items(items: List[schema.WebItem]) -> List[schema.WebItem]:
-    """Compute scores for Web items.
-
-    Weights: 55% relevance + 45% recency - 10pt penalty + bonuses
-    Web items lack engagement data, so they rank below Reddit/X/HN by default.
-    Extra snippets and citation provenance provide small bonuses for richer results.
-    """
-    if not items:
-        return items
+def _web_adjustment(item: schema.WebItem) -> int:
+    """Flat bonuses/penalties for web items."""
+    # Source penalty (no engagement data)
+    adj = -WEB_SOURCE_PENALTY
+    # Extra snippets bonus (more content = more relevant)
+    if item.extra_snippets:
+        adj += WEB_EXTRA_SNIPPETS_BONUS
+    # Citation bonus (items from deep research citations are higher quality)
+    if item.is_cited:
+        adj += WEB_CITATION_BONUS
+    return adj
 
-    for item in items:
-        rel_score = int(item.relevance * 100)
-        rec_score = dates.recency_score(item.date)
 
-        item.subs = schema.SubScores(
-            relevance=rel_score,
-            recency=rec_score,
-            engagement=0,
-        )
+def _discussion_engagement_proxy(item: schema.DiscussionItem) -> int:
+    """Engagement proxy: extra_snippets count maps to engagement signal."""
+    snippet_count = len(item.extra_snippets) if item.extra_snippets else 0
+    return min(100, snippet_count * 20)  # 0-5 snippets -> 0-100
 
-        overall = (
-            WEB_WEIGHT_RELEVANCE * rel_score +
-            WEB_WEIGHT_RECENCY * rec_score
-        )
 
-        # Source penalty (no engagement data)
-        overall -= WEB_SOURCE_PENALTY
+def score_news_items(items: List[schema.NewsItem]) -> List[schema.NewsItem]:
+    """Compute scores for News items.
 
-        # Extra snippets bonus (more content = more relevant)
-        if item.extra_snippets:
-            overall += WEB_EXTRA_SNIPPETS_BONUS
+    Weights: 45% relevance + 55% recency (time-sensitive, no engagement data)
+    News articles are time-critical so recency gets higher weight.
+    """
+    return _score_without_engagement(items, NEWS_WEIGHT_RELEVANCE, NEWS_WEIGHT_RECENCY)
 
-        # Citation bonus (items from deep research citations are higher quality)
-        if item.is_cited:
-            overall += WEB_CITATION_BONUS
 
-        overall = _apply_date_confidence(overall, item.date_confidence)
-        item.score = max(0, min(100, int(overall)))
+def score_web_items(items: List[schema.WebItem]) -> List[schema.WebItem]:
+    """Compute scores for Web items.
 
-    return items
+    Weights: 55% relevance + 45% recency - 10pt penalty + bonuses
+    Web items lack engagement data, so they rank below Reddit/X/HN by default.
+    Extra snippets and citation provenance provide small bonuses for richer results.
+    """
+    return _score_without_engagement(
+        items, WEB_WEIGHT_RELEVANCE, WEB_WEIGHT_RECENCY,
+        adjust_fn=_web_adjustment,
+    )
 
 
 def score_video_items(items: List[schema.VideoItem]) -> List[schema.VideoItem]:
@@ -297,28 +323,7 @@ def score_video_items(items: List[schema.VideoItem]) -> List[schema.VideoItem]:
 
     Weights: 50% relevance + 50% recency (balanced, no engagement data)
     """
-    if not items:
-        return items
-
-    for item in items:
-        rel_score = int(item.relevance * 100)
-        rec_score = dates.recency_score(item.date)
-
-        item.subs = schema.SubScores(
-            relevance=rel_score,
-            recency=rec_score,
-            engagement=0,
-        )
-
-        overall = (
-            VIDEO_WEIGHT_RELEVANCE * rel_score +
-            VIDEO_WEIGHT_RECENCY * rec_score
-        )
-
-        overall = _apply_date_confidence(overall, item.date_confidence)
-        item.score = max(0, min(100, int(overall)))
-
-    return items
+    return _score_without_engagement(items, VIDEO_WEIGHT_RELEVANCE, VIDEO_WEIGHT_RECENCY)
 
 
 def score_discussion_items(items: List[schema.DiscussionItem]) -> List[schema.DiscussionItem]:
@@ -329,33 +334,11 @@ def score_discussion_items(items: List[schema.DiscussionItem]) -> List[schema.Di
     (extra_snippets count as engagement signal since forums with more
     content indicate deeper discussion).
     """
-    if not items:
-        return items
-
-    for item in items:
-        rel_score = int(item.relevance * 100)
-        rec_score = dates.recency_score(item.date)
-
-        # Engagement proxy: extra_snippets count maps to engagement signal
-        snippet_count = len(item.extra_snippets) if item.extra_snippets else 0
-        eng_proxy = min(100, snippet_count * 20)  # 0-5 snippets -> 0-100
-
-        item.subs = schema.SubScores(
-            relevance=rel_score,
-            recency=rec_score,
-            engagement=eng_proxy,
-        )
-
-        overall = (
-            DISCUSSION_WEIGHT_RELEVANCE * rel_score +
-            DISCUSSION_WEIGHT_RECENCY * rec_score +
-            DISCUSSION_WEIGHT_ENGAGEMENT * eng_proxy
-        )
-
-        overall = _apply_date_confidence(overall, item.date_confidence)
-        item.score = max(0, min(100, int(overall)))
-
-    return items
+    return _score_without_engagement(
+        items, DISCUSSION_WEIGHT_RELEVANCE, DISCUSSION_WEIGHT_RECENCY,
+        weight_eng=DISCUSSION_WEIGHT_ENGAGEMENT,
+        eng_fn=_discussion_engagement_proxy,
+    )
 
 
 # Type union for all scoreable items
@@ -376,14 +359,40 @@ SOURCE_PRIORITY = {
 }
 
 
+@lru_cache(maxsize=2048)
+def _date_sort_value(date_str: str) -> int:
+    """Descending-order sort value for a YYYY-MM-DD string, memoized.
+
+    Items commonly share dates, so the replace + int parse runs once per
+    distinct date rather than once per item per sort.
+    """
+    return -int(date_str.replace("-", ""))
+
+
 def sort_items(items: List[AnyItem]) -> List[AnyItem]:
     """Sort items by score (descending), then date, then source priority."""
-    def sort_key(item):
-        score = -item.score
-        date = item.date or "0000-00-00"
-        date_key = -int(date.replace("-", ""))
-        source_priority = SOURCE_PRIORITY.get(type(item), 9)
-        text = getattr(item, "title", "") or getattr(item, "text", "")
-        return (score, date_key, source_priority, text)
+    if not items:
+        return []
+
+    # Single-source lists (the per-source sort before rendering) don't
+    # need the priority tiebreaker at all — it's constant across the list.
+    first_type = type(items[0])
+    if all(type(item) is first_type for item in items):
+        def sort_key(item):
+            score = -item.score
+            date_key = _date_sort_value(item.date or "0000-00-00")
+            text = getattr(item, "title", "") or getattr(item, "text", "")
+            return (score, date_key, text)
+    else:
+        # Bound once; closure-local reads beat a global dict attribute
+        # lookup inside the per-item key function.
+        priority_of = SOURCE_PRIORITY.get
+
+        def sort_key(item):
+            score = -item.score
+            date_key = _date_sort_value(item.date or "0000-00-00")
+            source_priority = priority_of(type(item), 9)
+            text = getattr(item, "title", "") or getattr(item, "text", "")
+            return (score, date_key, source_priority, text)
 
     return sorted(items, key=sort_key)
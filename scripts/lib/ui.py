@@ -1,9 +1,10 @@
 """Terminal UI utilities for last30days skill."""
 
+import re
 import sys
 import time
 import threading
-import random
+from itertools import cycle
 from typing import Optional
 
 # Check if we're in a real terminal (not captured by Claude Code)
@@ -108,6 +109,18 @@ PROCESSING_MESSAGES = [
     "Organizing findings...",
 ]
 
+# Rotate the cosmetic status messages deterministically; next() on a
+# cycle is cheaper than random.choice and keeps output reproducible.
+_REDDIT_CYCLE = cycle(REDDIT_MESSAGES)
+_X_CYCLE = cycle(X_MESSAGES)
+_HN_CYCLE = cycle(HN_MESSAGES)
+_NEWS_CYCLE = cycle(NEWS_MESSAGES)
+_WEB_CYCLE = cycle(WEB_MESSAGES)
+_VIDEO_CYCLE = cycle(VIDEO_MESSAGES)
+_SUMMARIZER_CYCLE = cycle(SUMMARIZER_MESSAGES)
+_ENRICHING_CYCLE = cycle(ENRICHING_MESSAGES)
+_PROCESSING_CYCLE = cycle(PROCESSING_MESSAGES)
+
 # Promo messages for missing API keys
 PROMO_MESSAGE = f"""
 {Colors.YELLOW}{Colors.BOLD}━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━{Colors.RESET}
@@ -125,22 +138,6 @@ PROMO_MESSAGE = f"""
 {Colors.YELLOW}{Colors.BOLD}━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━{Colors.RESET}
 """
 
-PROMO_MESSAGE_PLAIN = """
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-UNLOCK THE FULL POWER OF /last30days
-
-Right now you're using HN only. Add API keys to unlock:
-
-  Perplexity (via OpenRouter) - Reddit, News, Web, Videos, Discussions, AI Summary
-     └─ Add OPENROUTER_API_KEY (get it at openrouter.ai/settings/keys)
-
-  X (Twitter) - Real-time posts, likes, reposts from creators
-     └─ Add XAI_API_KEY (uses xAI's live X search)
-
-Setup: Edit ~/.config/last30days/.env
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-"""
-
 PROMO_SINGLE_KEY = {
     "openrouter": f"""
 {Colors.DIM}Tip: Add {Colors.ORANGE}OPENROUTER_API_KEY{Colors.RESET}{Colors.DIM} to ~/.config/last30days/.env for Reddit, News, Web, Videos & AI Summary!{Colors.RESET}
@@ -150,191 +147,292 @@ PROMO_SINGLE_KEY = {
 """,
 }
 
-PROMO_SINGLE_KEY_PLAIN = {
-    "openrouter": "\nTip: Add OPENROUTER_API_KEY to ~/.config/last30days/.env for Reddit, News, Web, Videos & AI Summary!\n",
-    "x": "\nTip: Add XAI_API_KEY to ~/.config/last30days/.env for X/Twitter data with real likes & reposts!\n",
-}
+# Plain variants derived by stripping the ANSI escapes, so the colored
+# and plain promos can never drift apart.
+_ANSI_RE = re.compile(r"\x1b\[[0-9;]*m")
+PROMO_MESSAGE_PLAIN = _ANSI_RE.sub("", PROMO_MESSAGE)
+PROMO_SINGLE_KEY_PLAIN = {k: _ANSI_RE.sub("", v) for k, v in PROMO_SINGLE_KEY.items()}
+
+# Colored source labels, rendered once instead of per phase transition
+_LBL_REDDIT = f"{Colors.YELLOW}Reddit{Colors.RESET}"
+_LBL_X = f"{Colors.CYAN}X{Colors.RESET}"
+_LBL_HN = f"{Colors.GREEN}HN{Colors.RESET}"
+_LBL_NEWS = f"{Colors.ORANGE}News{Colors.RESET}"
+_LBL_WEB = f"{Colors.BLUE}Web{Colors.RESET}"
+_LBL_VIDEO = f"{Colors.PURPLE}Video{Colors.RESET}"
+_LBL_SUMMARY = f"{Colors.BLUE}Summary{Colors.RESET}"
+_LBL_PROCESSING = f"{Colors.PURPLE}Processing{Colors.RESET}"
+
+# ANSI carriage-return + erase-line; 4 bytes instead of an 82-byte
+# space-padded clear allocated per call
+_CLEAR_LINE = "\r\x1b[2K"
 
 # Spinner frames
 SPINNER_FRAMES = ['⠋', '⠙', '⠹', '⠸', '⠼', '⠴', '⠦', '⠧', '⠇', '⠏']
 
 
-class Spinner:
-    """Animated spinner for long-running operations."""
+class _TTYSpinner:
+    """Animated spinner for long-running operations (real terminal)."""
 
     def __init__(self, message: str = "Working", color: str = Colors.CYAN):
         self.message = message
         self.color = color
         self.running = False
+        self.paused = False
         self.thread: Optional[threading.Thread] = None
-        self.frame_idx = 0
-        self.shown_static = False
+        self._stopped = False
+        self._stop_event = threading.Event()
+        # Serializes frame writes against announce/set_phase so a tick
+        # can't redraw over a just-cleared line.
+        self._lock = threading.Lock()
+        # Colored frame prefixes are rendered once per color instead of
+        # per tick; cycle() advances at C level with bounded state.
+        self._prefixes = self._make_prefixes(color)
+
+    @staticmethod
+    def _make_prefixes(color: str):
+        return cycle(f"\r{color}{frame}{Colors.RESET} " for frame in SPINNER_FRAMES)
 
     def _spin(self):
+        write = sys.stderr.write
+        flush = sys.stderr.flush
+        wait = self._stop_event.wait
         while self.running:
-            frame = SPINNER_FRAMES[self.frame_idx % len(SPINNER_FRAMES)]
-            sys.stderr.write(f"\r{self.color}{frame}{Colors.RESET} {self.message}  ")
-            sys.stderr.flush()
-            self.frame_idx += 1
-            time.sleep(0.08)
+            with self._lock:
+                if self.running and not self.paused:
+                    write(next(self._prefixes) + self.message + "  ")
+                    flush()
+            # Event wait instead of sleep: stop() interrupts the 80ms
+            # tick immediately rather than waiting it out.
+            if wait(0.08):
+                break
 
     def start(self):
         self.running = True
-        if IS_TTY:
-            self.thread = threading.Thread(target=self._spin, daemon=True)
-            self.thread.start()
-        else:
-            if not self.shown_static:
-                sys.stderr.write(f"  {self.message}\n")
-                sys.stderr.flush()
-                self.shown_static = True
+        self.paused = False
+        self._stopped = False
+        self._stop_event.clear()
+        self.thread = threading.Thread(target=self._spin, daemon=True)
+        self.thread.start()
+
+    def set_phase(self, message: str, color: str):
+        """Repoint the running spinner at a new phase.
+
+        Reuses the live thread instead of join/spawn per phase; only
+        re-renders the frame prefixes when the color actually changes.
+        """
+        with self._lock:
+            self.message = message
+            if color != self.color:
+                self.color = color
+                self._prefixes = self._make_prefixes(color)
+            self.paused = False
+
+    def announce(self, final_message: str = ""):
+        """Print a phase's final line, keeping the thread alive for reuse."""
+        with self._lock:
+            self.paused = True
+            out = _CLEAR_LINE
+            if final_message:
+                out += f"  {final_message}\n"
+            sys.stderr.write(out)
+            sys.stderr.flush()
 
     def update(self, message: str):
         self.message = message
-        if not IS_TTY and not self.shown_static:
-            sys.stderr.write(f"  {message}\n")
-            sys.stderr.flush()
 
     def stop(self, final_message: str = ""):
+        # Idempotent: a second stop (or stop before start) must not pay
+        # the join timeout on a dead or absent thread.
+        if self._stopped:
+            return
+        self._stopped = True
         self.running = False
-        if self.thread:
+        self._stop_event.set()
+        if self.thread is not None and self.thread.is_alive():
             self.thread.join(timeout=0.2)
-        if IS_TTY:
-            sys.stderr.write("\r" + " " * 80 + "\r")
+        # One write per stop: clear-line and final message go out together
+        out = _CLEAR_LINE
+        if final_message:
+            out += f"  {final_message}\n"
+        sys.stderr.write(out)
+        sys.stderr.flush()
+
+
+class _StaticSpinner:
+    """Plain-line fallback when stderr is captured (CI, piped output).
+
+    Same interface as _TTYSpinner but prints each transition once and
+    never spawns a thread.
+    """
+
+    def __init__(self, message: str = "Working", color: str = Colors.CYAN):
+        self.message = message
+        self.color = color
+        self.shown_static = False
+
+    def start(self):
+        if not self.shown_static:
+            sys.stderr.write(f"  {self.message}\n")
+            sys.stderr.flush()
+            self.shown_static = True
+
+    def set_phase(self, message: str, color: str):
+        self.message = message
+        self.color = color
+        sys.stderr.write(f"  {message}\n")
+        sys.stderr.flush()
+
+    def announce(self, final_message: str = ""):
+        if final_message:
+            sys.stderr.write(f"  {final_message}\n")
+            sys.stderr.flush()
+
+    def update(self, message: str):
+        self.message = message
+        if not self.shown_static:
+            sys.stderr.write(f"  {message}\n")
+            sys.stderr.flush()
+
+    def stop(self, final_message: str = ""):
         if final_message:
             sys.stderr.write(f"  {final_message}\n")
         sys.stderr.flush()
 
 
+def Spinner(message: str = "Working", color: str = Colors.CYAN):
+    """Build the spinner variant for the current stderr.
+
+    Factory keeps the call sites unchanged while hoisting the IS_TTY
+    branch out of every method; non-TTY runs never touch threading.
+    """
+    cls = _TTYSpinner if IS_TTY else _StaticSpinner
+    return cls(message, color)
+
+
 class ProgressDisplay:
     """Progress display for research phases."""
 
     def __init__(self, topic: str, show_banner: bool = True):
         self.topic = topic
-        self.spinner: Optional[Spinner] = None
-        self.start_time = time.time()
+        self.spinner = None
+        # Monotonic integer clock: immune to wall-clock jumps, so the
+        # reported elapsed time can never go negative.
+        self.start_time_ns = time.monotonic_ns()
 
         if show_banner:
             self._show_banner()
 
     def _show_banner(self):
         if IS_TTY:
-            sys.stderr.write(MINI_BANNER + "\n")
-            sys.stderr.write(f"{Colors.DIM}Topic: {Colors.RESET}{Colors.BOLD}{self.topic}{Colors.RESET}\n\n")
+            sys.stderr.write(
+                MINI_BANNER + "\n"
+                f"{Colors.DIM}Topic: {Colors.RESET}{Colors.BOLD}{self.topic}{Colors.RESET}\n\n"
+            )
         else:
             sys.stderr.write(f"/last30days - researching: {self.topic}\n")
         sys.stderr.flush()
 
-    def _stop_current(self):
+    def _phase(self, message: str, color: str):
+        """Point the shared spinner at a new phase, creating it lazily.
+
+        One thread serves every phase; transitions just swap the message
+        and color instead of paying a join + spawn per source.
+        """
+        if self.spinner is None:
+            self.spinner = Spinner(message, color)
+            self.spinner.start()
+        else:
+            self.spinner.set_phase(message, color)
+
+    def _announce(self, final_message: str = ""):
+        if self.spinner:
+            self.spinner.announce(final_message)
+
+    def _shutdown(self):
         if self.spinner:
             self.spinner.stop()
+            self.spinner = None
 
     # Reddit
     def start_reddit(self):
-        self._stop_current()
-        msg = random.choice(REDDIT_MESSAGES)
-        self.spinner = Spinner(f"{Colors.YELLOW}Reddit{Colors.RESET} {msg}", Colors.YELLOW)
-        self.spinner.start()
+        msg = next(_REDDIT_CYCLE)
+        self._phase(f"{_LBL_REDDIT} {msg}", Colors.YELLOW)
 
     def end_reddit(self, count: int):
-        if self.spinner:
-            self.spinner.stop(f"{Colors.YELLOW}Reddit{Colors.RESET} Found {count} threads")
+        self._announce(f"{_LBL_REDDIT} Found {count} threads")
 
     def start_reddit_enrich(self, current: int, total: int):
-        self._stop_current()
-        msg = random.choice(ENRICHING_MESSAGES)
-        self.spinner = Spinner(f"{Colors.YELLOW}Reddit{Colors.RESET} [{current}/{total}] {msg}", Colors.YELLOW)
-        self.spinner.start()
+        msg = next(_ENRICHING_CYCLE)
+        self._phase(f"{_LBL_REDDIT} [{current}/{total}] {msg}", Colors.YELLOW)
 
     def update_reddit_enrich(self, current: int, total: int):
         if self.spinner:
-            msg = random.choice(ENRICHING_MESSAGES)
-            self.spinner.update(f"{Colors.YELLOW}Reddit{Colors.RESET} [{current}/{total}] {msg}")
+            msg = next(_ENRICHING_CYCLE)
+            self.spinner.update(f"{_LBL_REDDIT} [{current}/{total}] {msg}")
 
     def end_reddit_enrich(self):
-        if self.spinner:
-            self.spinner.stop(f"{Colors.YELLOW}Reddit{Colors.RESET} Enriched with engagement data")
+        self._announce(f"{_LBL_REDDIT} Enriched with engagement data")
 
     # X
     def start_x(self):
-        self._stop_current()
-        msg = random.choice(X_MESSAGES)
-        self.spinner = Spinner(f"{Colors.CYAN}X{Colors.RESET} {msg}", Colors.CYAN)
-        self.spinner.start()
+        msg = next(_X_CYCLE)
+        self._phase(f"{_LBL_X} {msg}", Colors.CYAN)
 
     def end_x(self, count: int):
-        if self.spinner:
-            self.spinner.stop(f"{Colors.CYAN}X{Colors.RESET} Found {count} posts")
+        self._announce(f"{_LBL_X} Found {count} posts")
 
     # HN
     def start_hn(self):
-        self._stop_current()
-        msg = random.choice(HN_MESSAGES)
-        self.spinner = Spinner(f"{Colors.GREEN}HN{Colors.RESET} {msg}", Colors.GREEN)
-        self.spinner.start()
+        msg = next(_HN_CYCLE)
+        self._phase(f"{_LBL_HN} {msg}", Colors.GREEN)
 
     def end_hn(self, count: int):
-        if self.spinner:
-            self.spinner.stop(f"{Colors.GREEN}HN{Colors.RESET} Found {count} stories")
+        self._announce(f"{_LBL_HN} Found {count} stories")
 
     # News
     def start_news(self):
-        self._stop_current()
-        msg = random.choice(NEWS_MESSAGES)
-        self.spinner = Spinner(f"{Colors.ORANGE}News{Colors.RESET} {msg}", Colors.ORANGE)
-        self.spinner.start()
+        msg = next(_NEWS_CYCLE)
+        self._phase(f"{_LBL_NEWS} {msg}", Colors.ORANGE)
 
     def end_news(self, count: int):
-        if self.spinner:
-            self.spinner.stop(f"{Colors.ORANGE}News{Colors.RESET} Found {count} articles")
+        self._announce(f"{_LBL_NEWS} Found {count} articles")
 
     # Web
     def start_web(self):
-        self._stop_current()
-        msg = random.choice(WEB_MESSAGES)
-        self.spinner = Spinner(f"{Colors.BLUE}Web{Colors.RESET} {msg}", Colors.BLUE)
-        self.spinner.start()
+        msg = next(_WEB_CYCLE)
+        self._phase(f"{_LBL_WEB} {msg}", Colors.BLUE)
 
     def end_web(self, count: int, discussion_count: int = 0):
-        if self.spinner:
-            extra = f" + {discussion_count} discussions" if discussion_count else ""
-            self.spinner.stop(f"{Colors.BLUE}Web{Colors.RESET} Found {count} results{extra}")
+        extra = f" + {discussion_count} discussions" if discussion_count else ""
+        self._announce(f"{_LBL_WEB} Found {count} results{extra}")
 
     # Videos
     def start_videos(self):
-        self._stop_current()
-        msg = random.choice(VIDEO_MESSAGES)
-        self.spinner = Spinner(f"{Colors.PURPLE}Video{Colors.RESET} {msg}", Colors.PURPLE)
-        self.spinner.start()
+        msg = next(_VIDEO_CYCLE)
+        self._phase(f"{_LBL_VIDEO} {msg}", Colors.PURPLE)
 
     def end_videos(self, count: int):
-        if self.spinner:
-            self.spinner.stop(f"{Colors.PURPLE}Video{Colors.RESET} Found {count} videos")
+        self._announce(f"{_LBL_VIDEO} Found {count} videos")
 
     # Summarizer
     def start_summarizer(self):
-        self._stop_current()
-        msg = random.choice(SUMMARIZER_MESSAGES)
-        self.spinner = Spinner(f"{Colors.BLUE}Summary{Colors.RESET} {msg}", Colors.BLUE)
-        self.spinner.start()
+        msg = next(_SUMMARIZER_CYCLE)
+        self._phase(f"{_LBL_SUMMARY} {msg}", Colors.BLUE)
 
     def end_summarizer(self, has_summary: bool):
-        if self.spinner:
-            if has_summary:
-                self.spinner.stop(f"{Colors.BLUE}Summary{Colors.RESET} AI summary generated")
-            else:
-                self.spinner.stop(f"{Colors.BLUE}Summary{Colors.RESET} No summary available")
+        if has_summary:
+            self._announce(f"{_LBL_SUMMARY} AI summary generated")
+        else:
+            self._announce(f"{_LBL_SUMMARY} No summary available")
 
     # Processing
     def start_processing(self):
-        self._stop_current()
-        msg = random.choice(PROCESSING_MESSAGES)
-        self.spinner = Spinner(f"{Colors.PURPLE}Processing{Colors.RESET} {msg}", Colors.PURPLE)
-        self.spinner.start()
+        msg = next(_PROCESSING_CYCLE)
+        self._phase(f"{_LBL_PROCESSING} {msg}", Colors.PURPLE)
 
     def end_processing(self):
-        if self.spinner:
-            self.spinner.stop()
+        self._announce()
 
     def show_complete(
         self,
@@ -346,11 +444,10 @@ class ProgressDisplay:
         video_count: int = 0,
         discussion_count: int = 0,
     ):
-        elapsed = time.time() - self.start_time
+        self._shutdown()
+        elapsed = (time.monotonic_ns() - self.start_time_ns) / 1_000_000_000
+        # Assemble the whole block first: one write + one flush per call
         if IS_TTY:
-            sys.stderr.write(f"\n{Colors.GREEN}{Colors.BOLD}Research complete{Colors.RESET} ")
-            sys.stderr.write(f"{Colors.DIM}({elapsed:.1f}s){Colors.RESET}\n")
-
             parts = []
             if reddit_count:
                 parts.append(f"{Colors.YELLOW}Reddit:{Colors.RESET} {reddit_count}")
@@ -367,9 +464,14 @@ class ProgressDisplay:
             if discussion_count:
                 parts.append(f"Discussions: {discussion_count}")
 
+            out = (
+                f"\n{Colors.GREEN}{Colors.BOLD}Research complete{Colors.RESET} "
+                f"{Colors.DIM}({elapsed:.1f}s){Colors.RESET}\n"
+            )
             if parts:
-                sys.stderr.write("  " + "  ".join(parts) + "\n")
-            sys.stderr.write("\n")
+                out += "  " + "  ".join(parts) + "\n"
+            out += "\n"
+            sys.stderr.write(out)
         else:
             parts = []
             if reddit_count:
@@ -398,6 +500,7 @@ class ProgressDisplay:
         sys.stderr.flush()
 
     def show_error(self, message: str):
+        self._shutdown()
         sys.stderr.write(f"{Colors.RED}Error:{Colors.RESET} {message}\n")
         sys.stderr.flush()
 
@@ -1,13 +1,17 @@
 """Tests for models module (xAI only)."""
 
 import sys
+import tempfile
 import unittest
 from pathlib import Path
 
-# Add lib to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+# Add lib to path; resolved once so import probing works on a canonical
+# absolute path instead of a relative ../scripts chain
+_SCRIPTS_DIR = str((Path(__file__).parent.parent / "scripts").resolve())
+if _SCRIPTS_DIR not in sys.path:
+    sys.path.insert(0, _SCRIPTS_DIR)
 
-from lib import models
+from lib import cache, models
 
 
 class TestIsGrokSearchCapable(unittest.TestCase):
@@ -33,10 +37,23 @@ class TestIsGrokSearchCapable(unittest.TestCase):
         self.assertFalse(models.is_grok_search_capable("llama-3"))
 
 
-class TestSelectXAIModel(unittest.TestCase):
+class ModelCacheIsolationMixin:
+    """Point the model cache at a temp file for the duration of each test.
+
+    Keeps the suite hermetic: no reads of (or damage to) the real user
+    cache, and no per-test unlink calls against it.
+    """
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self._orig_cache_file = cache.MODEL_CACHE_FILE
+        cache.MODEL_CACHE_FILE = Path(tmp.name) / "model_selection.json"
+        self.addCleanup(setattr, cache, "MODEL_CACHE_FILE", self._orig_cache_file)
+
+
+class TestSelectXAIModel(ModelCacheIsolationMixin, unittest.TestCase):
     def test_latest_policy_prefers_fast_reasoning(self):
-        from lib import cache
-        cache.MODEL_CACHE_FILE.unlink(missing_ok=True)
         mock_models = [
             {"id": "grok-4-1-fast-reasoning", "created": 1706227200},
             {"id": "grok-4-1-fast", "created": 1704067200},
@@ -51,8 +68,6 @@ class TestSelectXAIModel(unittest.TestCase):
         self.assertEqual(result, "grok-4-1-fast-reasoning")
 
     def test_latest_falls_back_to_fast(self):
-        from lib import cache
-        cache.MODEL_CACHE_FILE.unlink(missing_ok=True)
         mock_models = [
             {"id": "grok-4-1-fast", "created": 1704067200},
             {"id": "grok-4-1", "created": 1704067200},
@@ -65,8 +80,6 @@ class TestSelectXAIModel(unittest.TestCase):
         self.assertEqual(result, "grok-4-1-fast")
 
     def test_stable_policy(self):
-        from lib import cache
-        cache.MODEL_CACHE_FILE.unlink(missing_ok=True)
         result = models.select_xai_model(
             "fake-key",
             policy="stable",
@@ -82,8 +95,6 @@ class TestSelectXAIModel(unittest.TestCase):
         self.assertEqual(result, "grok-3")
 
     def test_fallback_when_no_models(self):
-        from lib import cache
-        cache.MODEL_CACHE_FILE.unlink(missing_ok=True)
         result = models.select_xai_model(
             "fake-key",
             policy="latest",
@@ -92,15 +103,13 @@ class TestSelectXAIModel(unittest.TestCase):
         self.assertEqual(result, "grok-4-1-fast-reasoning")
 
 
-class TestGetModels(unittest.TestCase):
+class TestGetModels(ModelCacheIsolationMixin, unittest.TestCase):
     def test_no_keys_returns_none(self):
         config = {}
         result = models.get_models(config)
         self.assertIsNone(result["xai"])
 
     def test_xai_key_selects_model(self):
-        from lib import cache
-        cache.MODEL_CACHE_FILE.unlink(missing_ok=True)
         config = {"XAI_API_KEY": "xai-test"}
         mock_xai = [
             {"id": "grok-4-1-fast-reasoning", "created": 1706227200},
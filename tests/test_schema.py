@@ -0,0 +1,67 @@
+"""Tests for schema module."""
+
+import sys
+import unittest
+from pathlib import Path
+
+# Add lib to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from lib import schema
+
+
+def _report_dict(**sections):
+    """Minimal serialized report with the given item sections."""
+    data = {
+        "topic": "test",
+        "range": {"from": "2026-07-30", "to": "2026-08-29"},
+        "generated_at": "2026-08-29T00:00:00+00:00",
+        "mode": "both",
+    }
+    data.update(sections)
+    return data
+
+
+class TestFromDictLegacyCaches(unittest.TestCase):
+    def test_missing_soft_string_fields_decode_as_empty(self):
+        # Older cache schemas omitted these required string fields;
+        # they must decode as '' rather than raising KeyError
+        report = schema.Report.from_dict(_report_dict(
+            hn=[{"id": "1", "title": "t", "url": "u"}],
+            news=[{"id": "2", "title": "t", "url": "u"}],
+            web=[{"id": "3", "title": "t", "url": "u"}],
+            videos=[{"id": "4", "title": "t", "url": "u"}],
+            discussions=[{"id": "5", "title": "t", "url": "u"}],
+        ))
+        self.assertEqual(report.hn[0].hn_url, "")
+        self.assertEqual(report.hn[0].author, "")
+        self.assertEqual(report.news[0].source_name, "")
+        self.assertEqual(report.news[0].source_domain, "")
+        self.assertEqual(report.web[0].source_domain, "")
+        self.assertEqual(report.videos[0].source_domain, "")
+        self.assertEqual(report.discussions[0].forum_name, "")
+
+    def test_null_string_fields_decode_without_error(self):
+        # Legacy caches can carry explicit nulls for these fields; the
+        # intern hooks must pass them through instead of raising TypeError
+        report = schema.Report.from_dict(_report_dict(
+            reddit=[{"id": "1", "title": "t", "url": "u", "subreddit": None,
+                     "date_confidence": None}],
+            web=[{"id": "2", "title": "t", "url": "u", "source_domain": None}],
+            discussions=[{"id": "3", "title": "t", "url": "u",
+                          "forum_name": None}],
+        ))
+        self.assertIsNone(report.reddit[0].subreddit)
+        self.assertIsNone(report.reddit[0].date_confidence)
+        self.assertIsNone(report.web[0].source_domain)
+        self.assertIsNone(report.discussions[0].forum_name)
+
+    def test_missing_required_key_still_raises(self):
+        with self.assertRaises(KeyError):
+            schema.Report.from_dict(_report_dict(
+                hn=[{"title": "t", "url": "u"}],  # no id
+            ))
+
+
+if __name__ == "__main__":
+    unittest.main()